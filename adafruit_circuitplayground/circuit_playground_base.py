@@ -23,6 +23,7 @@ import math
 import array
 import time
 import os
+import struct
 import audiocore
 import analogio
 import board
@@ -30,17 +31,34 @@ import busio
 import digitalio
 import adafruit_lis3dh
 import adafruit_thermistor
+from adafruit_bus_device.i2c_device import I2CDevice
 import neopixel
+import supervisor
 import touchio
 
 __version__ = "0.0.0-auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CircuitPlayground.git"
 
+# The sensor caches are timed with supervisor.ticks_ms(). It counts milliseconds in 29 bits and
+# wraps, so readings and differences stay small ints and polling does not allocate.
+_TICKS_MAX = (1 << 29) - 1
+
+
+def _ticks_elapsed(now, then):
+    """Milliseconds from ``then`` to ``now``, allowing for ticks_ms() wrapping around."""
+    return (now - then) & _TICKS_MAX
+
 
 class Photocell:
     """Simple driver for analog photocell on the Circuit Playground Express and Bluefruit."""
 
     # pylint: disable=too-few-public-methods
+
+    # Full scale light level. AnalogIn values are 16 bits, so the product in ``light`` is at
+    # most 65535 * 330, well inside the small int range of 32-bit CircuitPython builds. Keep
+    # it that way if this changes, or every reading will allocate a long int.
+    _LIGHT_NUM = 330
+
     def __init__(self, pin):
         self._photocell = analogio.AnalogIn(pin)
 
@@ -48,7 +66,7 @@ class Photocell:
     @property
     def light(self):
         """Light level."""
-        return self._photocell.value * 330 // (2**16)
+        return (self._photocell.value * self._LIGHT_NUM) >> 16
 
 
 class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
@@ -58,6 +76,41 @@ class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
     SINE_WAVE = 0
     SQUARE_WAVE = 1
 
+    # LIS3DH OUT_X_L register with the auto-increment bit set. Reading 18 bytes from here covers
+    # OUT_X_L through CLICK_SRC, so acceleration and tap state come from one I2C transaction.
+    # The burst also reads INT1_SRC and INT2_SRC, which clears any latched inertial interrupt.
+    # Neither this library nor adafruit_lis3dh enables those interrupts, so nothing is lost
+    # unless they are configured directly on the accelerometer.
+    _ACCEL_OUT_X_L = b"\xA8"
+    # Position of CLICK_SRC (0x39) in the burst read buffer.
+    _CLICK_SRC_OFFSET = 0x39 - 0x28
+    # Raw counts per g for each accelerometer range, as used by adafruit_lis3dh.
+    _ACCEL_DIVIDERS = {
+        adafruit_lis3dh.RANGE_2_G: 16380,
+        adafruit_lis3dh.RANGE_4_G: 8190,
+        adafruit_lis3dh.RANGE_8_G: 4096,
+        adafruit_lis3dh.RANGE_16_G: 1365,
+    }
+
+    # (time_limit, time_latency, time_window) used by the detect_taps setter for each tap type.
+    # The threshold depends on the board, see _default_tap_threshold.
+    _TAP_CONFIG = {
+        1: (4, 50, 255),
+        2: (10, 50, 255),
+    }
+
+    # Pins used for the touch pads. Slot 0 is not used (A0 is not allowed as a touch pin).
+    _TOUCH_PINS = (
+        None,
+        board.A1,
+        board.A2,
+        board.A3,
+        board.A4,
+        board.A5,
+        board.A6,
+        board.TX,
+    )
+
     def __init__(self):
         # Define switch:
         self._switch = digitalio.DigitalInOut(board.SLIDE_SWITCH)
@@ -65,41 +118,52 @@ class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
 
         # Define LEDs:
         self._led = digitalio.DigitalInOut(board.D13)
-        self._led.switch_to_output()
-        self._pixels = neopixel.NeoPixel(board.NEOPIXEL, 10)
+        self._led.switch_to_output(value=False)
+        # We are the only writer of the LED pin, so keep its state here for cheap reads.
+        self._led_state = False
+        # NeoPixels and sensors are set up the first time they are used.
+        self._pixels = None
 
         # Define sensors:
-        self._temp = adafruit_thermistor.Thermistor(
-            board.TEMPERATURE, 10000, 10000, 25, 3950
-        )
-        self._light = Photocell(board.LIGHT)
+        self._temp = None
+        self._light = None
+        # (ticks_ms timestamp, value) of the last reading, reused until older than the TTL. The
+        # timestamp is None until the sensor has been read.
+        self._temp_cache = (None, 0.0)
+        self._temp_ttl_ms = 100
+        self._light_cache = (None, 0)
+        self._light_ttl_ms = 20
 
         # Define touch:
-        # Initially, self._touches stores the pin used for a particular touch. When that touch is
-        # used for the first time, the pin is replaced with the corresponding TouchIn object.
-        # This saves a little RAM over using a separate read-only pin tuple.
-        # For example, after `cp.touch_A2`, self._touches is equivalent to:
-        # [None, board.A1, touchio.TouchIn(board.A2), board.A3, ...]
-        # Slot 0 is not used (A0 is not allowed as a touch pin).
-        self._touches = [
-            None,
-            board.A1,
-            board.A2,
-            board.A3,
-            board.A4,
-            board.A5,
-            board.A6,
-            board.TX,
-        ]
+        # TouchIn objects are created the first time a pad is used and stored here by the
+        # pad's index into _TOUCH_PINS.
+        self._touch_ins = {}
         self._touch_threshold_adjustment = 0
-
-        # Define acceleration:
-        self._i2c = busio.I2C(board.ACCELEROMETER_SCL, board.ACCELEROMETER_SDA)
-        self._int1 = digitalio.DigitalInOut(board.ACCELEROMETER_INTERRUPT)
-        self._lis3dh = adafruit_lis3dh.LIS3DH_I2C(
-            self._i2c, address=0x19, int1=self._int1
-        )
-        self._lis3dh.range = adafruit_lis3dh.RANGE_8_G
+        # Each slot holds (ticks_ms timestamp, value) of the last physical read. The timestamp is
+        # None until the pad has been read.
+        self._touch_cache = [(None, False)] * 8
+        self._touch_ttl_ms = 20
+
+        # Define acceleration. The accelerometer is set up the first time it is used.
+        self._i2c = None
+        self._int1 = None
+        self._lis3dh = None
+        # Our own handle on the accelerometer and buffer for burst reads of the output registers.
+        self._accel_device = None
+        self._accel_buf = None
+        # acceleration, tapped and shake share one register snapshot that is refreshed when it is
+        # older than _snapshot_ttl_ms. Reading CLICK_SRC clears the tap, so a tap seen by any
+        # refresh is held in _tap_pending until tapped reports it. _snapshot_ts is None when the
+        # snapshot must be read again.
+        self._sensor_snapshot = None
+        self._snapshot_ts = None
+        self._snapshot_ttl_ms = 2
+        self._tap_pending = False
+        # The range and set_tap arguments are kept here and written when the accelerometer is
+        # set up, or straight away if it already is.
+        self._accel_scale = 0
+        self._set_accel_range(adafruit_lis3dh.RANGE_8_G)
+        self._tap_settings = None
 
         # Define audio:
         self._speaker_enable = digitalio.DigitalInOut(board.SPEAKER_ENABLE)
@@ -108,8 +172,11 @@ class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
         self._wave = None
         self._wave_sample = None
 
-        # Initialise tap:
-        self._detect_taps = 1
+        # Initialise tap. After a tap is reported, further polls within the minimum interval
+        # return False without touching the accelerometer. None until the first tap.
+        self._tap_last_ms = None
+        self._tap_min_interval_ms = 5
+
         self.detect_taps = 1
 
         # Initialise buttons:
@@ -150,22 +217,42 @@ class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
     @detect_taps.setter
     def detect_taps(self, value):
         self._detect_taps = value
-        if value == 1:
-            self._lis3dh.set_tap(
-                value,
-                self._default_tap_threshold(value),
-                time_limit=4,
-                time_latency=50,
-                time_window=255,
-            )
-        if value == 2:
-            self._lis3dh.set_tap(
-                value,
-                self._default_tap_threshold(value),
-                time_limit=10,
-                time_latency=50,
-                time_window=255,
-            )
+        config = self._TAP_CONFIG.get(value)
+        if config is not None:
+            self._set_tap((value, self._default_tap_threshold(value)) + config)
+
+    def _setup_accelerometer(self):
+        self._i2c = busio.I2C(board.ACCELEROMETER_SCL, board.ACCELEROMETER_SDA)
+        self._int1 = digitalio.DigitalInOut(board.ACCELEROMETER_INTERRUPT)
+        self._lis3dh = adafruit_lis3dh.LIS3DH_I2C(
+            self._i2c, address=0x19, int1=self._int1
+        )
+        # The driver has already checked the accelerometer is there, so skip the probe.
+        self._accel_device = I2CDevice(self._i2c, 0x19, probe=False)
+        self._accel_buf = bytearray(18)
+        self._lis3dh.range = self._accel_range
+        if self._tap_settings is not None:
+            self._write_tap_settings()
+
+    def _set_tap(self, settings):
+        # settings are the set_tap arguments: (tap, threshold, time_limit, time_latency,
+        # time_window).
+        self._tap_settings = settings
+        # A tap held from the previous setting must not be reported under the new one.
+        self._tap_pending = False
+        self._snapshot_ts = None
+        if self._lis3dh is not None:
+            self._write_tap_settings()
+
+    def _write_tap_settings(self):
+        tap, threshold, time_limit, time_latency, time_window = self._tap_settings
+        self._lis3dh.set_tap(
+            tap,
+            threshold,
+            time_limit=time_limit,
+            time_latency=time_latency,
+            time_window=time_window,
+        )
 
     def configure_tap(  # pylint: disable-msg=too-many-arguments
         self,
@@ -212,14 +299,9 @@ class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
 
         self._detect_taps = tap
 
-        if accel_range not in [
-            adafruit_lis3dh.RANGE_2_G,
-            adafruit_lis3dh.RANGE_4_G,
-            adafruit_lis3dh.RANGE_8_G,
-            adafruit_lis3dh.RANGE_16_G,
-        ]:
+        if accel_range not in self._ACCEL_DIVIDERS:
             accel_range = adafruit_lis3dh.RANGE_8_G
-        self._lis3dh.range = accel_range
+        self._set_accel_range(accel_range)
 
         if tap == 1:
             if threshold is None or threshold < 0 or threshold > 127:
@@ -236,13 +318,7 @@ class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
             threshold = 100
             time_limit = 1
 
-        self._lis3dh.set_tap(
-            tap,
-            threshold,
-            time_limit=time_limit,
-            time_latency=time_latency,
-            time_window=time_window,
-        )
+        self._set_tap((tap, threshold, time_limit, time_latency, time_window))
 
     @property
     def tapped(self):
@@ -294,7 +370,54 @@ class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
           print("Reached 2 double-taps!")
           print("Done.")
         """
-        return self._lis3dh.tapped
+        now = supervisor.ticks_ms()
+        if (
+            self._tap_last_ms is not None
+            and _ticks_elapsed(now, self._tap_last_ms) < self._tap_min_interval_ms
+        ):
+            return False
+        # The interrupt pin is high while a tap is latched, so only go to the bus when it is.
+        if self._lis3dh is None:
+            self._setup_accelerometer()
+        if not self._tap_pending and self._int1.value:
+            self._refresh_lis3dh()
+        tapped = self._tap_pending
+        self._tap_pending = False
+        if tapped:
+            self._tap_last_ms = now
+        return tapped
+
+    def _set_accel_range(self, accel_range):
+        # Remember the scale for the range we set so reading acceleration does not have to
+        # read the range back from the accelerometer every time.
+        self._accel_range = accel_range
+        self._accel_scale = (
+            adafruit_lis3dh.STANDARD_GRAVITY / self._ACCEL_DIVIDERS[accel_range]
+        )
+        self._snapshot_ts = None
+        if self._lis3dh is not None:
+            self._lis3dh.range = accel_range
+
+    def _refresh_lis3dh(self):
+        now = supervisor.ticks_ms()
+        if (
+            self._snapshot_ts is not None
+            and _ticks_elapsed(now, self._snapshot_ts) < self._snapshot_ttl_ms
+        ):
+            return
+        if self._lis3dh is None:
+            self._setup_accelerometer()
+        buf = self._accel_buf
+        with self._accel_device as i2c:
+            i2c.write_then_readinto(self._ACCEL_OUT_X_L, buf)
+        raw_x, raw_y, raw_z = struct.unpack_from("<hhh", buf)
+        scale = self._accel_scale
+        self._sensor_snapshot = adafruit_lis3dh.AccelerationTuple(
+            raw_x * scale, raw_y * scale, raw_z * scale
+        )
+        if buf[self._CLICK_SRC_OFFSET] & 0x40:
+            self._tap_pending = True
+        self._snapshot_ts = now
 
     @property
     def acceleration(self):
@@ -316,7 +439,8 @@ class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
               x, y, z = cp.acceleration
               print(x, y, z)
         """
-        return self._lis3dh.acceleration
+        self._refresh_lis3dh()
+        return self._sensor_snapshot
 
     def shake(self, shake_threshold=30):
         """Detect when device is shaken.
@@ -350,15 +474,63 @@ class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
               if cp.shake(shake_threshold=20):
                   print("Shake detected more easily than before!")
         """
-        return self._lis3dh.shake(shake_threshold=shake_threshold)
+        # Same averaging as adafruit_lis3dh's shake, but sampled through the shared snapshot.
+        # The 10 samples and 0.01 s sleep are that method's avg_count=10 and total_delay=0.1
+        # defaults; keep them in step if the driver changes.
+        total_x = total_y = total_z = 0
+        for _ in range(10):
+            accel_x, accel_y, accel_z = self.acceleration
+            total_x += accel_x
+            total_y += accel_y
+            total_z += accel_z
+            time.sleep(0.01)
+        return (
+            math.sqrt(total_x * total_x + total_y * total_y + total_z * total_z) / 10
+            > shake_threshold
+        )
 
     def _touch(self, i):
-        if not isinstance(self._touches[i], touchio.TouchIn):
-            # First time referenced. Get the pin from the slot for this touch
-            # and replace it with a TouchIn object for the pin.
-            self._touches[i] = touchio.TouchIn(self._touches[i])
-            self._touches[i].threshold += self._touch_threshold_adjustment
-        return self._touches[i].value
+        # Reading TouchIn is slow, so reuse the last value until it is older than the TTL.
+        now = supervisor.ticks_ms()
+        timestamp, value = self._touch_cache[i]
+        if (
+            timestamp is not None
+            and _ticks_elapsed(now, timestamp) < self._touch_ttl_ms
+        ):
+            return value
+        touch_in = self._touch_ins.get(i)
+        if touch_in is None:
+            # First time referenced. Create a TouchIn object for the pin.
+            touch_in = touchio.TouchIn(self._TOUCH_PINS[i])
+            touch_in.threshold += self._touch_threshold_adjustment
+            self._touch_ins[i] = touch_in
+        value = touch_in.value
+        self._touch_cache[i] = (now, value)
+        return value
+
+    @property
+    def touch_refresh_ms(self):
+        """Minimum time in milliseconds between physical reads of a capacitive touch pad.
+        Reading a touch pad more often than this returns the previous result. Defaults to
+        ``20``. Set to ``0`` to read the pad on every access.
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+
+          cp.touch_refresh_ms = 50
+
+          while True:
+              if cp.touch_A1:
+                  print('Touched pad A1')
+        """
+        return self._touch_ttl_ms
+
+    @touch_refresh_ms.setter
+    def touch_refresh_ms(self, value):
+        self._touch_ttl_ms = int(value)
 
     # We chose these verbose touch_A# names so that beginners could use it without understanding
     # lists and the capital A to match the pin name. The capitalization is not strictly Python
@@ -518,9 +690,8 @@ class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
               if cp.touch_A1:
                   print('Touched pad A1')
         """
-        for touch_in in self._touches:
-            if isinstance(touch_in, touchio.TouchIn):
-                touch_in.threshold += adjustment
+        for touch_in in self._touch_ins.values():
+            touch_in.threshold += adjustment
         self._touch_threshold_adjustment += adjustment
 
     @property
@@ -548,7 +719,24 @@ class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
           cp.pixels.brightness = 0.3
           cp.pixels[0] = 0x00FF00
           cp.pixels[9] = (255, 0, 0)
+
+        Setting pixels one at a time sends the data to every pixel after each change. To set
+        all of them to the same color at once, use ``fill``. To change several pixels and
+        update them together, turn off ``auto_write`` and call ``show`` when you are done.
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+
+          cp.pixels.fill((0, 0, 32))
+
+          cp.pixels.auto_write = False
+          for i in range(0, 10, 2):
+              cp.pixels[i] = (32, 0, 0)
+          cp.pixels.show()
         """
+        if self._pixels is None:
+            self._pixels = neopixel.NeoPixel(board.NEOPIXEL, 10)
         return self._pixels
 
     @property
@@ -639,7 +827,40 @@ class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
               print("Temperature fahrenheit:", temperature_f)
               time.sleep(1)
         """
-        return self._temp.temperature
+        now = supervisor.ticks_ms()
+        timestamp, temperature = self._temp_cache
+        if timestamp is not None and _ticks_elapsed(now, timestamp) < self._temp_ttl_ms:
+            return temperature
+        if self._temp is None:
+            self._temp = adafruit_thermistor.Thermistor(
+                board.TEMPERATURE, 10000, 10000, 25, 3950
+            )
+        temperature = self._temp.temperature
+        self._temp_cache = (now, temperature)
+        return temperature
+
+    @property
+    def temperature_refresh_ms(self):
+        """Minimum time in milliseconds between physical reads of the temperature sensor.
+        Reading ``temperature`` more often than this returns the previous result. Defaults to
+        ``100``. Set to ``0`` to read the sensor on every access.
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+
+          cp.temperature_refresh_ms = 1000
+
+          while True:
+              print("Temperature celsius:", cp.temperature)
+        """
+        return self._temp_ttl_ms
+
+    @temperature_refresh_ms.setter
+    def temperature_refresh_ms(self, value):
+        self._temp_ttl_ms = int(value)
 
     @property
     def light(self):
@@ -661,7 +882,41 @@ class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
               print("Light:", cp.light)
               time.sleep(1)
         """
-        return self._light.light
+        now = supervisor.ticks_ms()
+        timestamp, light = self._light_cache
+        if (
+            timestamp is not None
+            and _ticks_elapsed(now, timestamp) < self._light_ttl_ms
+        ):
+            return light
+        if self._light is None:
+            self._light = Photocell(board.LIGHT)
+        light = self._light.light
+        self._light_cache = (now, light)
+        return light
+
+    @property
+    def light_refresh_ms(self):
+        """Minimum time in milliseconds between physical reads of the light sensor.
+        Reading ``light`` more often than this returns the previous result. Defaults to
+        ``20``. Set to ``0`` to read the sensor on every access.
+
+        To use with the Circuit Playground Express or Bluefruit:
+
+        .. code-block:: python
+
+          from adafruit_circuitplayground import cp
+
+          cp.light_refresh_ms = 0
+
+          while True:
+              print("Light:", cp.light)
+        """
+        return self._light_ttl_ms
+
+    @light_refresh_ms.setter
+    def light_refresh_ms(self, value):
+        self._light_ttl_ms = int(value)
 
     @property
     def red_led(self):
@@ -683,11 +938,13 @@ class CircuitPlaygroundBase:  # pylint: disable=too-many-public-methods
               cp.red_led = False
               time.sleep(0.5)
         """
-        return self._led.value
+        return self._led_state
 
     @red_led.setter
     def red_led(self, value):
+        value = bool(value)
         self._led.value = value
+        self._led_state = value
 
     @staticmethod
     def _sine_sample(length):
@@ -40,7 +40,9 @@ autodoc_mock_imports = [
     "audioio",
     "touchio",
     "adafruit_lis3dh",
+    "adafruit_bus_device",
     "busio",
+    "supervisor",
     "audiocore",
     "audiopwmio",
     "audiobusio",